@@ -1,8 +1,26 @@
+import copy
 import json
+import os
+from functools import lru_cache
+
+# config.json lives beside the Pyssembler package, not wherever we run from
+CONFIG_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.json')
+
+@lru_cache(maxsize=None)
+def _read_config():
+    with open(CONFIG_FILE, 'r') as in_file:
+        return json.load(in_file)
+
+def load_config():
+    """
+    Reads config.json once and returns a fresh copy of the parsed
+    contents to every caller, so changes made by one never leak into
+    the next
+    """
+    return copy.deepcopy(_read_config())
 
 class Config():
     def __init__(self):
-        with open('config.json', 'r') as in_file:
-            config = json.load(in_file)
-            for key, value in config.items():
-                setattr(self, key, value)
\ No newline at end of file
+        for key, value in load_config().items():
+            setattr(self, key.replace('-', '_'), value)
\ No newline at end of file
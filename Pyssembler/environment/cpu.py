@@ -1,6 +1,15 @@
-import json
+from Pyssembler.config import load_config
+from Pyssembler.environment.helpers import binary, REGISTERS
 
-from Pyssembler.environment.helpers import binary
+def __open_register_names():
+    # Copy the shared table, the translator must not see PC or IR
+    names = dict(REGISTERS)
+    names['PC'] = '$pc'
+    names['IR'] = 'IR'
+    return names
+
+# Register address -> name, read once and shared by every RegisterFile
+REGISTER_NAMES = __open_register_names()
 
 class CPU():
     def __init__(self):
@@ -18,7 +27,7 @@ class CPU():
         return self.__m.read(address)
     
     def ram_write(self, data, address):
-        self.__m.write(address, data)
+        self.__m.write(data, address)
     
     @property
     def reg_state(self):
@@ -35,70 +44,49 @@ class CPU():
 
 class States():
     def __init__(self):
-        with open("config.json", "r") as in_file:
-            self.file = json.load(in_file)
-            try:
-                self.register_states = self.file["registers"]
-            except:
-                self.register_states = None
-            try:
-                self.m_states = self.file["Memory"]
-            except:
-                self.m_states = None
+        self.file = load_config()
+        self.register_states = self.file.get("registers")
+        self.m_states = self.file.get("Memory")
 
 class RegisterFile():
     def __init__(self):
-        with open("Pyssembler/environment/registers.json", "r") as reg_in:
-            self.reg_bin = json.load(reg_in)
-        self.__registers = {}
-        self.__registers[binary(0, 5)] = {"zero": 0}
-        self.__registers[binary(1, 5)] = {"$at": 0}
-        for i in range(2, 4):
-            self.__registers[binary(i, 5)] = {"$v{}".format(i - 2):0}
-        for i in range(4, 8):
-            self.__registers[binary(i, 5)] = {"$a{}".format(i - 4):0}
-        for i in range(8, 16):
-            self.__registers[binary(i, 5)] = {"$t{}".format(i - 8):0}
-        for i in range(16, 24):
-            self.__registers[binary(i, 5)] = {"$s{}".format(i - 16):0}
-        for i in range(24, 26):
-            self.__registers[binary(i, 5)] = {"$t{}".format(i - 16):0}
-        for i in range(26, 28):
-            self.__registers[binary(i, 5)] = {"$k{}".format(i - 26):0}
-        self.__registers[binary(28, 5)] = {"$gp":0}
-        self.__registers[binary(29, 5)] = {"$sp":0}
-        self.__registers[binary(30, 5)] = {"$fp":0}
-        self.__registers[binary(31, 5)] = {"$ra":0}
-        self.__registers['PC'] = {"$pc":0}
-        self.__registers['IR'] = {"IR":0}
+        self.reg_bin = REGISTER_NAMES
+        # Values are kept flat by address so read/write are one lookup,
+        # names are only joined back in when the state is requested
+        self.__values = dict.fromkeys(REGISTER_NAMES, 0)
         
     def read(self, address):
-        return self.__registers[address][self.reg_bin[address]]
+        return self.__values[address]
 
     def write(self, data, address):
-        self.__registers[address][self.reg_bin[address]] = data
+        self.__values[address] = data
     
     @property
     def registers(self):
-        return self.__registers
+        """
+        Snapshot of the registers as {address: {name: value}}, built on
+        each access, changes to it do not reach the register file, use
+        write() for that
+        """
+        return {
+            address: {self.reg_bin[address]: value}
+            for address, value in self.__values.items()
+        }
     
     @property
     def print(self):
         output = {}
-        for reg in self.__registers.values():
-            output[reg.name] = reg.value
+        for address, value in self.__values.items():
+            output[self.reg_bin[address]] = value
         return output
 
 class Memory():
     def __init__(self):
-        self.memory = {}
-        for i in range(0, 2049, 4):
-            self.memory[binary(i, 32)] = 0
+        self.memory = dict.fromkeys(
+            (binary(i, 32) for i in range(0, 2049, 4)), 0)
 
-    def read(self, address): 
-        output = {}
-        for key, value in self.memory.items():
-            output[int(key)] = value
+    def read(self, address):
+        return self.memory[address]
     
     def write(self, data, address):  
         self.memory[address] = data
@@ -108,8 +96,8 @@ class Memory():
         return self.memory
     
 class IM():
-    def __init__(self, instructions={}):
-        self.instructions = instructions
+    def __init__(self, instructions=None):
+        self.instructions = {} if instructions is None else instructions
     
     def read_instruction(self, address):
         return self.instructions[address]
@@ -1,48 +1,52 @@
 import os, json
 
+REGISTERS_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "registers.json")
+
+def __open_registers():
+    with open(REGISTERS_FILE, "r") as reg_in:
+        return json.load(reg_in)
+
+# Register code -> name, read once and shared by the translator and cpu
+REGISTERS = __open_registers()
+
+# Zero padded format spec for each field width binary() encodes
+BINARY_FORMATS = {bits: '0{}b'.format(bits) for bits in (5, 16, 26, 32)}
+
 def binary(n, bits: int):
     output = ""
-    n = int(n)
-    negative = False
+    if isinstance(n, str):
+        # int(n, 0) handles signs and 0x/0o/0b prefixes in one call,
+        # plain int() still covers decimals written with leading zeros
+        try:
+            n = int(n, 0)
+        except ValueError:
+            n = int(n)
+    else:
+        n = int(n)
     if n < 0:
-        negative = True
-        n *= -1
-    if bits == 5:
-        output = f'{n:05b}'
-    elif bits == 16:
-        output = f'{n:016b}'
-    elif bits == 26:
-        output = f'{n:026b}'
-    elif bits == 32:
-        output = f'{n:032b}'
-    if negative:
-        output = binary(integer(invert(output))+1, bits)
+        # Two's complement is just the low bits of n, widened when the
+        # magnitude needs more bits than were asked for
+        n &= (1 << max(bits, (-n).bit_length())) - 1
+    spec = BINARY_FORMATS.get(bits)
+    if spec is not None:
+        output = format(n, spec)
     return output
 
 def integer(b, complement=False):
+    value = int(b, 2)
     if complement:
-        if b[0] == "1":
-            tmp = invert(binary(integer(b)-1, len(b)))
-            return int('0b'+tmp, 2)*-1
-    return int('0b'+b, 2)
-
-def invert(binary):
-    output = ""
-    for b in binary:
-        if b == "0":
-            output += "1"
-        else:
-            output += "0"
-    return output
+        # Sign extend from the top bit of b without branching on it
+        sign = 1 << (len(b) - 1)
+        return (value ^ sign) - sign
+    return value
 
 def clean_code(code):
     output = []
     for line in code:
-        if line == '':
-            continue
-        if not line.startswith("#"):
-            if "#" in line:
-                output.append(line.split("#", 1)[0].lstrip(' '))
-            elif not line.isspace():
-                output.append(line.lstrip(' '))
+        # Strip the comment and test what is left in one pass,
+        # blank and comment-only lines leave nothing behind
+        text = line.partition("#")[0]
+        if text and not text.isspace():
+            output.append(text.lstrip(' '))
     return output
@@ -1,14 +1,15 @@
 import json
 import logging
+import os
 
-from Pyssembler.environment.helpers import integer, binary, clean_code
-from Pyssembler.settings import Settings
+from Pyssembler.environment.helpers import integer, binary, clean_code, REGISTERS
+from Pyssembler.config import Config
 from Pyssembler.errors import *
 
 log = logging.getLogger(__name__)
 
-REGISTERS = "Pyssembler/environment/registers.json"
-TEMPLATES = "Pyssembler/environment/instructions.json"
+TEMPLATES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "instructions.json")
 
 #
 # INSTRUCTIONS CATEGORIZED BY ENCODING
@@ -31,39 +32,59 @@ INSTR_013 = [
 INSTR_01 = ['div', 'divu', 'mult', 'multu']
 INSTR_015 = ['sll', 'sra', 'srl']
 
-BRANCHES = ['000100', '000001', '000111', '000110', '000101']
-JUMPS = ['000010', '000011']
-
-def __open_instruction(key):
+# Maps each mnemonic to the encoding category it belongs to
+INSTR_ENCODING = {
+    instr: encoding
+    for encoding in (
+        INSTR_PARENTHESIS, INSTR_BRANCH, INSTR_J, INSTR_0,
+        INSTR_012, INSTR_013, INSTR_01, INSTR_015
+    )
+    for instr in encoding
+}
+
+# Opcodes are only ever tested for membership, so keep them in sets
+BRANCHES = frozenset(['000100', '000001', '000111', '000110', '000101'])
+JUMPS = frozenset(['000010', '000011'])
+
+def __open_templates():
     with open(TEMPLATES, "r") as output:
-        return json.load(output)[key]
-
-def __open_reg():
-    with open(REGISTERS, 'r') as output:
         return json.load(output)
 
+# instructions.json is read once at import rather than on every lookup,
+# registers.json is shared with the cpu through helpers
+INSTRUCTION_TEMPLATES = __open_templates()
+REG_BY_CODE = REGISTERS
+
+# Register name -> register code, inverted once rather than on every call
+REG_BY_NAME = {value: key for key, value in REG_BY_CODE.items()}
+
+def __open_instruction(key):
+    return INSTRUCTION_TEMPLATES[key]
+
 def verify_binary(line, line_num, length):
     opcodes = __open_instruction("OPCODES")
     if len(line) != 32:
         raise InvalidSizeError(line, line_num)
-    if line[:6] not in opcodes.keys():
-        raise InvalidOperationError(line, line_num, line[:6])
-    if line[:6] == "000000":
-        if line[26:] not in opcodes[line[:6]].keys():
+    opcode = line[:6]
+    if opcode not in opcodes:
+        raise InvalidOperationError(line, line_num, opcode)
+    if opcode == "000000":
+        if line[26:] not in opcodes[opcode]:
             raise InvalidFunctionError(line, line_num, line[26:])
-    if line[:6] in JUMPS:
-        if integer(line[6:]) < 0 or integer(line[6:]) > length:
+    if opcode in JUMPS:
+        target = integer(line[6:])
+        if target < 0 or target > length:
             raise InvalidTargetError(line, line_num, line[6:])
-    if line[:6] in BRANCHES:
+    if opcode in BRANCHES:
         offset = integer(line[16:], complement=True)+line_num
         if offset < 0 or offset > length:
             raise InvalidOffsetError(line, line_num, line[16:])
 
 def verify_mips(line, line_num, labels):
-    REG = {value: key for key, value in __open_reg().items()}
+    REG = REG_BY_NAME
     mips = line.replace(',', '').split()
     if ':' in mips[0]:
-        if mips[0].replace(':', '') not in labels.keys():
+        if mips[0].replace(':', '') not in labels:
             raise InvalidLabelError(line, line_num, mips[0].replace(':', ''))
         mips.pop(0)
     if mips[0] in INSTR_PARENTHESIS:
@@ -83,8 +104,7 @@ def mips_to_binary(code):
 
     log.debug("Preparing translation: MIPS -> Binary...")
     code = clean_code(code)
-    print(code)
-    REG = {value: key for key, value in __open_reg().items()}
+    REG = REG_BY_NAME
     BINS = __open_instruction("BINS")
     result = []
 
@@ -108,6 +128,7 @@ def mips_to_binary(code):
         if ':' in mips[0]:
             mips.pop(0)
         instr = mips[0]
+        encoding = INSTR_ENCODING.get(instr)
         reg1 = None
         reg2 = None
         reg3 = None
@@ -115,47 +136,41 @@ def mips_to_binary(code):
         i_26 = None
         i_5 =  None
         
-        if instr == "noop":
-            result.append(BINS[instr])
-            continue
-
-        elif instr == 'syscall':
-            result.append(BINS[instr])
-            continue
-        
-        elif instr in INSTR_PARENTHESIS:
+        # Operand-less instructions (noop, syscall) have no encoding
+        # and fall through with a template that takes no fields
+        if encoding is INSTR_PARENTHESIS:
             reg1 = REG[mips[1]]
             reg2 = REG[mips[2].split('(')[1].replace(')', '')]
             i_16 = binary(mips[2].split('(')[0], 16)
 
-        elif instr in INSTR_BRANCH:
+        elif encoding is INSTR_BRANCH:
             reg1 = REG[mips[1]]
             if instr == 'beq' or instr == 'bne':
                 reg2 = REG[mips[2]]
             offset = labels[mips[len(mips)-1]] - cnt
             i_16 = binary(offset, 16)
 
-        elif instr in INSTR_J:
+        elif encoding is INSTR_J:
             i_26 = binary(labels[mips[1]], 26)
 
-        elif instr in INSTR_0:
+        elif encoding is INSTR_0:
             reg1 = REG[mips[1]]
         
-        elif instr in INSTR_012:
+        elif encoding is INSTR_012:
             reg1 = REG[mips[1]]
             reg2 = REG[mips[2]]
             reg3 = REG[mips[3]]
         
-        elif instr in INSTR_013:
+        elif encoding is INSTR_013:
             reg1 = REG[mips[1]]
             reg2 = REG[mips[2]]
             i_16 = binary(mips[3], 16)
         
-        elif instr in INSTR_01:
+        elif encoding is INSTR_01:
             reg1 = REG[mips[1]]
             reg2 = REG[mips[2]]
         
-        elif instr in INSTR_015:
+        elif encoding is INSTR_015:
             reg1 = REG[mips[1]]
             reg2 = REG[mips[2]]
             i_5 = binary(mips[3], 5)
@@ -167,26 +182,24 @@ def mips_to_binary(code):
 def binary_to_mips(code):
     log.debug("Preparing translation: Binary -> MIPS")
     code = clean_code(code)
-    REG = __open_reg()
+    REG = REG_BY_CODE
     OPCODE = __open_instruction("OPCODES")
     result = []
 
     log.debug("Generating labels...")
     labels={}
     label_cnt = 1
-    label_name = Settings().translator_config["label-name"]
+    label_name = Config().translator_config["label-name"]
     cnt = 0
     for line in code:
+        target = None
         if line[:6] in BRANCHES:
             target = integer(line[16:], complement=True) + cnt
-            if not target in labels.keys():
-                labels[target] = "{}{}".format(label_name, label_cnt)
-                label_cnt += 1
         elif line[:6] in JUMPS:
             target = integer(line[6:])
-            if not target in labels.keys():
-                labels[target] = "{}{}".format(label_name, label_cnt)
-                label_cnt += 1
+        if target is not None and target not in labels:
+            labels[target] = "{}{}".format(label_name, label_cnt)
+            label_cnt += 1
         cnt += 1
     log.debug('Generated {} labels!'.format(len(labels.keys())))
 
@@ -203,22 +216,13 @@ def binary_to_mips(code):
         i_5 = integer(line[21:26], complement=True)
         label = None
         if instr in BRANCHES:
-            label = labels[integer(line[16:], complement=True) + cnt]
+            label = labels[i_16 + cnt]
         elif instr in JUMPS:
             label = labels[integer(line[6:], complement=True)]
 
-        try:
-            reg1 = REG[line[6:11]]
-        except:
-            reg1 = None
-        try:
-            reg2 = REG[line[11:16]]
-        except:
-            reg2 = None
-        try:
-            reg3 = REG[line[16:21]]
-        except:
-            reg3 = None
+        reg1 = REG.get(line[6:11])
+        reg2 = REG.get(line[11:16])
+        reg3 = REG.get(line[16:21])
 
         if instr == "000000" or instr == "000001":
             result.append(OPCODE[instr][line[26:]].format(reg1, reg2, reg3, i_16, i_5, label))
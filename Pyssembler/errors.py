@@ -0,0 +1,43 @@
+class TranslationError(Exception):
+    """
+    Base class for errors found while translating a line of code
+    """
+    def __init__(self, line, line_num, message):
+        self.line = line
+        self.line_num = line_num
+        self.message = message
+        super().__init__('Line {}: {} ({})'.format(line_num, message, line))
+
+class InvalidSizeError(TranslationError):
+    def __init__(self, line, line_num):
+        super().__init__(line, line_num, 'Instruction is not 32 bits long')
+
+class InvalidOperationError(TranslationError):
+    def __init__(self, line, line_num, opcode):
+        self.opcode = opcode
+        super().__init__(line, line_num, 'Unknown opcode {}'.format(opcode))
+
+class InvalidFunctionError(TranslationError):
+    def __init__(self, line, line_num, funct):
+        self.funct = funct
+        super().__init__(line, line_num, 'Unknown function code {}'.format(funct))
+
+class InvalidTargetError(TranslationError):
+    def __init__(self, line, line_num, target):
+        self.target = target
+        super().__init__(line, line_num, 'Jump target {} is out of range'.format(target))
+
+class InvalidOffsetError(TranslationError):
+    def __init__(self, line, line_num, offset):
+        self.offset = offset
+        super().__init__(line, line_num, 'Branch offset {} is out of range'.format(offset))
+
+class InvalidLabelError(TranslationError):
+    def __init__(self, line, line_num, label):
+        self.label = label
+        super().__init__(line, line_num, 'Unknown label {}'.format(label))
+
+class InvalidRegisterError(TranslationError):
+    def __init__(self, line, line_num, register):
+        self.register = register
+        super().__init__(line, line_num, 'Unknown register {}'.format(register))
@@ -51,9 +51,15 @@ class App():
     
     def configure_editor(self, state):
         self.editor.text.config(state=state)
+
+    def is_editor_modified(self):
+        return self.editor.text.edit_modified()
+
+    def reset_editor_modified(self):
+        self.editor.text.edit_modified(False)
     
     def syntax_editor(self):
-        self.editor.text.highlight_syntax()
+        self.editor.text.highlight_changes()
         
 
 def run():
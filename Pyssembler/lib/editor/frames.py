@@ -1,10 +1,20 @@
 import tkinter as tk
 from tkinter.scrolledtext import ScrolledText
 
+EDITOR_FONT = ('Courier', 14, 'normal')
+
+# Highlighting tags and their options, configured once per editor
+TAG_STYLES = (
+    ('instr', {'background': 'dark orange'}),
+    ('reg', {'background': 'dodger blue'}),
+    ('comment', {'foreground': 'gray47'}),
+    ('error', {'background': 'red'}),
+)
+
 class Editor(tk.Frame):
     def __init__(self, master=None, **kwargs):
         tk.Frame.__init__(self, master, **kwargs)
-        self.text = CustomText(self, font=('Courier', 14, 'normal'), wrap=tk.NONE)
+        self.text = CustomText(self, font=EDITOR_FONT, wrap=tk.NONE)
         self.vsb = tk.Scrollbar(self, orient='vertical', command=self.text.yview)
         self.hsb = tk.Scrollbar(self, orient='horizontal', command=self.text.xview)
         self.text.configure(yscrollcommand=self.vsb.set)
@@ -13,14 +23,13 @@ class Editor(tk.Frame):
         self.linenumbers.attach(self.text)
 
         #Binding events
+        self._redraw_job = None
         self.text.bind('<<Change>>', self._on_change)
         self.text.bind('<Configure>', self._on_change)
 
         #Setup highlighting/syntax
-        self.text.tag_config('instr', background='dark orange')
-        self.text.tag_config('reg', background='dodger blue')
-        self.text.tag_config('comment', foreground='gray47')
-        self.text.tag_config('error', background='red')
+        for tag, options in TAG_STYLES:
+            self.text.tag_config(tag, **options)
 
         #Packing widgets
         self.vsb.pack(side='right', fill='y')
@@ -29,6 +38,13 @@ class Editor(tk.Frame):
         self.text.pack(side='right', fill='both', expand='true')
     
     def _on_change(self, event):
+        # A single keystroke or scroll emits several <<Change>> events,
+        # redraw the line numbers once when Tk is next idle
+        if self._redraw_job is None:
+            self._redraw_job = self.after_idle(self._redraw_linenumbers)
+
+    def _redraw_linenumbers(self):
+        self._redraw_job = None
         self.linenumbers.redraw()
 
 class CustomText(tk.Text):
@@ -41,11 +57,38 @@ class CustomText(tk.Text):
         self.tk.createcommand(self._w, self._proxy)
         self.bind("<<Paste>>", self.paste)
 
+        # the start marks keep left gravity so text inserted at them
+        # lands inside the range, set once here rather than per edit
+        for mark in ('editStart', 'changeStart'):
+            self._call('mark', 'set', mark, '1.0')
+            self._call('mark', 'gravity', mark, tk.LEFT)
+
+        # set when the changeStart/changeEnd marks bound text edited since
+        # the last highlight, marks move with the text so they stay valid
+        self._changed = False
+
+    def _call(self, *args):
+        # talk to the real widget directly so bookkeeping calls made
+        # while handling an edit do not loop back through _proxy
+        return self.tk.call((self._orig,) + args)
+
     def _proxy(self, *args):
+        edit = args[0] in ("insert", "replace", "delete")
+        if edit:
+            # editStart stays before and editEnd after any inserted text
+            self._call('mark', 'set', 'editStart', args[1])
+            if args[0] != "insert" and len(args) > 2:
+                self._call('mark', 'set', 'editEnd', args[2])
+            else:
+                self._call('mark', 'set', 'editEnd', args[1])
+
         # let the actual widget perform the requested action
         cmd = (self._orig,) + args
         result = self.tk.call(cmd)
 
+        if edit:
+            self._mark_changed('editStart linestart', 'editEnd lineend')
+
         # generate an event if something was added or deleted,
         # or the cursor position changed
         if (args[0] in ("insert", "replace", "delete") or 
@@ -71,22 +114,44 @@ class CustomText(tk.Text):
         self.see(tk.INSERT)
         return "break"
 
+    def _mark_changed(self, start, end):
+        if not self._changed:
+            self._call('mark', 'set', 'changeStart', start)
+            self._call('mark', 'set', 'changeEnd', end)
+            self._changed = True
+            return
+        if self.tk.getboolean(self._call('compare', start, '<', 'changeStart')):
+            self._call('mark', 'set', 'changeStart', start)
+        if self.tk.getboolean(self._call('compare', end, '>', 'changeEnd')):
+            self._call('mark', 'set', 'changeEnd', end)
+
+    def highlight_changes(self):
+        '''highlight only the lines edited since the last highlight'''
+        if not self._changed:
+            return
+        self._changed = False
+        self.highlight_syntax('changeStart', 'changeEnd lineend')
+
     def highlight_syntax(self, start='1.0', end='end'):
-        start = self.index(start)
+        start = self.index('{} linestart'.format(start))
         end = self.index(end)
-        self.mark_set("matchStart", start)
-        self.mark_set("matchEnd", start)
-        self.mark_set("searchLimit", end)
-        count = tk.IntVar()
-        while True:
-            index = self.search('#', "matchEnd","searchLimit",
-                                count=count, regexp=True)
-            if index == "": break
-            if count.get() == 0: break
-            self.mark_set("matchStart", index)
-            #self.mark_set("matchEnd", "{}+{}c".format(index, count.get()))
-            self.mark_set('matchEnd', 'matchStart lineend')
-            self.tag_add('comment', 'matchStart', 'matchEnd')
+        self.tag_remove('comment', start, end)
+
+        # Fetch the range once and scan it here instead of issuing a
+        # search/mark/tag round trip to Tcl for every comment
+        first_line = int(start.split('.')[0])
+        lines = self.get(start, end).split('\n')
+        ranges = []
+        for line_num, line in enumerate(lines, first_line):
+            column = line.find('#')
+            if column != -1:
+                ranges.append('{}.{}'.format(line_num, column))
+                ranges.append('{}.end'.format(line_num))
+
+        # tag add accepts any number of index pairs, so every comment
+        # is tagged with a single call
+        if ranges:
+            self.tag_add('comment', *ranges)
 
 class TextLineNumbers(tk.Canvas):
     def __init__(self, *args, **kwargs):
@@ -100,14 +165,15 @@ class TextLineNumbers(tk.Canvas):
         '''redraw line numbers'''
         self.delete("all")
 
-        i = self.textwidget.index("@0,0")
+        # only the first visible line needs resolving, the following
+        # line numbers are counted here instead of asking Tk for each
+        linenum = int(self.textwidget.index("@0,0").split(".")[0])
         while True :
-            dline= self.textwidget.dlineinfo(i)
+            dline= self.textwidget.dlineinfo("{}.0".format(linenum))
             if dline is None: break
             y = dline[1]
-            linenum = str(i).split(".")[0]
-            self.create_text(2,y,anchor="nw", text=linenum)
-            i = self.textwidget.index("%s+1line" % i)
+            self.create_text(2,y,anchor="nw", text=str(linenum))
+            linenum += 1
 
 class Console(tk.Frame):
     def __init__(self, master=None, **kwargs):
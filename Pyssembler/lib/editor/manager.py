@@ -1,9 +1,18 @@
 from enum import Enum
 import logging
 import os
+import shutil
+import tempfile
 
 log = logging.getLogger(__name__)
 
+# Milliseconds of typing inactivity before the editor is re-highlighted
+HIGHLIGHT_DELAY = 50
+
+# Menu entries that are only enabled while a file is open
+MAIN_MENU_FILE_ENTRIES = ('Edit', 'Translate', 'Simulate')
+FILE_MENU_FILE_ENTRIES = ('Close File', 'Save', 'Save As')
+
 class State(Enum):
     HOME = 0
     SAVED = 1
@@ -18,6 +27,7 @@ class Manager():
         self.file_name = None
         self.state = None
         self.TITLE = '{} - Pyssembler'
+        self._highlight_job = None
     
     def link_menu(self, menu):
         self.menu = menu
@@ -26,14 +36,27 @@ class Manager():
         self.root.destroy()
     
     def highlight_syntax(self):
-        self.app.editor.highlight_syntax()
+        self.app.syntax_editor()
 
     def change_title(self, title):
         self.root.title(title)
     
     def on_editor_update(self, sv):
+        # Key releases also fire for keys that don't edit anything,
+        # Tk's modified flag says whether the text actually changed
+        if not self.app.is_editor_modified():
+            return
+        self.app.reset_editor_modified()
         if self.state is State.SAVED:
             self.change_state(State.UNSAVED)
+        # Restart the timer on every key so a burst of typing
+        # only highlights once
+        if self._highlight_job is not None:
+            self.root.after_cancel(self._highlight_job)
+        self._highlight_job = self.root.after(HIGHLIGHT_DELAY, self._on_highlight_timeout)
+
+    def _on_highlight_timeout(self):
+        self._highlight_job = None
         self.app.syntax_editor()
     
     def clear_editor(self):
@@ -45,39 +68,58 @@ class Manager():
     def change_state(self, state):
         log.debug('State change: {} to {}'.format(self.state, state))
         if state == State.HOME:
-            self.menu.entryconfig('Edit', state='disabled')
-            self.menu.entryconfig("Translate", state='disabled')
-            self.menu.entryconfig('Simulate', state='disabled')
-            self.menu.file_menu.entryconfig('Close File', state='disabled')
-            self.menu.file_menu.entryconfig('Save', state='disabled')
-            self.menu.file_menu.entryconfig('Save As', state='disabled')
+            self.set_file_entries('disabled')
             self.app.clear_editor()
             self.app.configure_editor('disabled')
             self.file_dir = None
             self.file_name = None
             self.change_title("Pyssembler")
         
-        else:
-            self.menu.entryconfig('Edit', state='normal')
-            self.menu.entryconfig("Translate", state='normal')
-            self.menu.entryconfig('Simulate', state='normal')
-            self.menu.file_menu.entryconfig('Close File', state='normal')
-            self.menu.file_menu.entryconfig('Save', state='normal')
-            self.menu.file_menu.entryconfig('Save As', state='normal')
+        elif self.state in (None, State.HOME):
+            # SAVED <-> UNSAVED leaves the menus untouched, only
+            # leaving HOME needs the entries re-enabled
+            self.set_file_entries('normal')
             self.app.configure_editor('normal')
+        if state != State.UNSAVED:
+            self.app.reset_editor_modified()
         self.state = state
     
+    def set_file_entries(self, state):
+        for label in MAIN_MENU_FILE_ENTRIES:
+            self.menu.entryconfig(label, state=state)
+        for label in FILE_MENU_FILE_ENTRIES:
+            self.menu.file_menu.entryconfig(label, state=state)
+    
     def save(self):
+        tmp_dir = None
         try:
             log.info('Saving file...')
-            with open(self.file_dir, 'w') as out:
+            # Write next to the real target (following symlinks) and swap
+            # it in, so a failed save never leaves a half written file
+            target = os.path.realpath(self.file_dir)
+            with tempfile.NamedTemporaryFile(
+                    'w', dir=os.path.dirname(target), delete=False) as out:
+                tmp_dir = out.name
                 out.write(self.app.get_text_editor())
+                out.flush()
+                os.fsync(out.fileno())
+            # create_file always makes the target first, so there is
+            # always a mode to carry over
+            shutil.copymode(target, tmp_dir)
+            os.replace(tmp_dir, target)
+            tmp_dir = None
             log.info('Saved file: '+self.file_dir)
             self.change_state(State.SAVED)
             return True
         except:
             log.info('Could not save file')
             return False
+        finally:
+            if tmp_dir is not None:
+                try:
+                    os.remove(tmp_dir)
+                except OSError:
+                    pass
 
     def create_file(self, file_dir):
         try:
@@ -101,6 +143,7 @@ class Manager():
                 self.change_state(State.SAVED)
                 self.app.clear_editor()
                 self.app.insert_text_editor(in_file.read())
+                self.app.reset_editor_modified()
                 self.file_dir = file_dir
                 self.file_name = os.path.basename(self.file_dir)
                 self.change_title(self.TITLE.format(self.file_dir))